@@ -7,18 +7,46 @@ This script publishes .pbix files to Power BI Service using the REST API.
 Supports both interactive and service principal authentication.
 
 Usage:
-    python powerbi_publisher.py --pbix report.pbix --workspace "My Workspace"
-    python powerbi_publisher.py --pbix report.pbix --workspace-id abc-123-def
+    python powerbi_publisher.py publish --pbix report.pbix --workspace "My Workspace"
+    python powerbi_publisher.py publish --pbix report.pbix --workspace-id abc-123-def
+    python powerbi_publisher.py publish --pbix sales.pbix ops.pbix --workspace "My Workspace"
+    python powerbi_publisher.py list-workspaces
+    python powerbi_publisher.py list-reports --workspace "My Workspace"
 """
 
 import os
 import sys
 import json
 import time
+import mmap
+import uuid
+import base64
+import random
+import asyncio
 import argparse
+import importlib.util
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+except ImportError:  # Fall back to requests' in-memory multipart body
+    MultipartEncoder = None
+
+try:
+    import httpx
+except ImportError:  # Only needed by AsyncPowerBIClient
+    httpx = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # Fall back to the stdlib parser
+    _loads = json.loads
 
 # =============================================================================
 # CONFIGURATION
@@ -29,6 +57,61 @@ POWER_BI_API_BASE = "https://api.powerbi.com/v1.0/myorg"
 AZURE_LOGIN_URL = "https://login.microsoftonline.com/{tenant_id}/oauth2/v2.0/token"
 POWER_BI_SCOPE = "https://analysis.windows.net/powerbi/api/.default"
 
+# Connection pooling / retry settings shared by all sessions
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 20
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# Explicit retries for throttled POSTs (urllib3 only retries idempotent calls)
+POST_RETRIES = 3
+
+# Large file (> 1GB) blob upload settings
+BLOB_BLOCK_SIZE = 8 * 1024 * 1024
+BLOB_UPLOAD_WORKERS = 8
+
+# Collection paging ($top is capped at 5000 by the API)
+PAGE_SIZE = 5000
+PAGE_WORKERS = 8
+
+
+def _json(response: requests.Response) -> Any:
+    """Decode a JSON response body"""
+    return _loads(response.content)
+
+
+def _retry_after_seconds(response, default: float) -> float:
+    """Seconds to wait from a Retry-After header, or the default if absent"""
+    retry_after = response.headers.get("Retry-After", "")
+    return float(retry_after) if retry_after.isdigit() else default
+
+
+def _next_poll_delay(delay: float, max_delay: float) -> float:
+    """Grow an import poll delay exponentially with jitter"""
+    return min(delay * 1.7 + random.uniform(0, 0.5), max_delay)
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session with a pooled, retrying HTTPS adapter"""
+    session = requests.Session()
+    # Throttling (429 + Retry-After) and transient 5xx are retried here for
+    # idempotent calls; the final response is returned so callers report it.
+    # POST is left out: urllib3 can't rewind a streamed upload body to replay it
+    retry = Retry(
+        total=6,
+        backoff_factor=1.0,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry
+    )
+    session.mount("https://", adapter)
+    return session
+
 # =============================================================================
 # AUTHENTICATION
 # =============================================================================
@@ -41,13 +124,20 @@ class PowerBIAuth:
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token = None
-        self.token_expiry = 0
+        self.auth_header = None
+        # Monotonic time after which the token must be refreshed (60s early)
+        self._deadline = 0.0
+        self.session = _create_session()
 
     def get_token(self) -> str:
         """Get access token using client credentials flow"""
-        if self.access_token and time.time() < self.token_expiry - 60:
+        if self.access_token is not None and time.monotonic() < self._deadline:
             return self.access_token
 
+        return self._refresh()
+
+    def _refresh(self) -> str:
+        """Request a new access token from Azure AD"""
         url = AZURE_LOGIN_URL.format(tenant_id=self.tenant_id)
 
         data = {
@@ -57,17 +147,37 @@ class PowerBIAuth:
             "scope": POWER_BI_SCOPE
         }
 
-        response = requests.post(url, data=data)
+        # The session adapter doesn't retry POSTs; the form body is safe to resend
+        for attempt in range(POST_RETRIES + 1):
+            response = self.session.post(url, data=data)
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == POST_RETRIES:
+                break
+
+            time.sleep(_retry_after_seconds(response, 2.0 * (attempt + 1)))
 
         if response.status_code != 200:
             raise Exception(f"Authentication failed: {response.text}")
 
-        token_data = response.json()
+        token_data = _json(response)
         self.access_token = token_data["access_token"]
-        self.token_expiry = time.time() + token_data.get("expires_in", 3600)
+        self._deadline = time.monotonic() + float(token_data.get("expires_in", 3600)) - 60
+        self.auth_header = f"Bearer {self.access_token}"
 
         return self.access_token
 
+    def ensure_fresh(self, session: requests.Session):
+        """Refresh the token if needed and keep the session's Authorization header current"""
+        if time.monotonic() >= self._deadline:
+            self._refresh()
+
+        if session.headers.get("Authorization") is not self.auth_header:
+            session.headers["Authorization"] = self.auth_header
+
+    def close(self):
+        """Close the token endpoint session"""
+        self.session.close()
+
 # =============================================================================
 # POWER BI CLIENT
 # =============================================================================
@@ -77,45 +187,82 @@ class PowerBIClient:
 
     def __init__(self, auth: PowerBIAuth):
         self.auth = auth
+        self.session = _create_session()
+        self._workspaces = None
+        self._ws_cache = None
 
-    def _headers(self) -> Dict[str, str]:
-        """Get authorization headers"""
-        return {
-            "Authorization": f"Bearer {self.auth.get_token()}",
-            "Content-Type": "application/json"
-        }
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
+        self.auth.close()
 
     def _request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """Make authenticated request to Power BI API"""
+        """Make authenticated request to Power BI API, retrying throttled POSTs"""
         url = f"{POWER_BI_API_BASE}{endpoint}"
-        headers = kwargs.pop("headers", {})
-        headers.update({"Authorization": f"Bearer {self.auth.get_token()}"})
 
-        response = requests.request(method, url, headers=headers, **kwargs)
-        return response
+        for attempt in range(POST_RETRIES + 1):
+            self.auth.ensure_fresh(self.session)
+            response = self.session.request(method, url, **kwargs)
+
+            # Other methods are retried by the session adapter
+            if method != "POST" or response.status_code != 429 or attempt == POST_RETRIES:
+                return response
+
+            time.sleep(_retry_after_seconds(response, 2.0 * (attempt + 1)))
 
     # -------------------------------------------------------------------------
     # Workspaces
     # -------------------------------------------------------------------------
 
-    def list_workspaces(self) -> list:
-        """List all workspaces the user has access to"""
-        response = self._request("GET", "/groups")
+    def _paged_get(self, endpoint: str, error_message: str, page_size: int = PAGE_SIZE) -> list:
+        """GET a $top/$skip paginated collection, fetching later pages concurrently"""
 
-        if response.status_code != 200:
-            raise Exception(f"Failed to list workspaces: {response.text}")
+        def fetch_page(skip: int) -> Dict:
+            response = self._request("GET", endpoint, params={"$top": page_size, "$skip": skip})
+
+            if response.status_code != 200:
+                raise Exception(f"{error_message}: {response.text}")
+
+            return _json(response)
+
+        first_page = fetch_page(0)
+        items = first_page.get("value", [])
+        total = first_page.get("@odata.count")
+
+        if total is None:
+            # No count to plan with - follow full pages until a short one
+            page = items
+            while len(page) == page_size:
+                page = fetch_page(len(items)).get("value", [])
+                items.extend(page)
+            return items
+
+        with ThreadPoolExecutor(max_workers=PAGE_WORKERS) as executor:
+            for page in executor.map(fetch_page, range(page_size, total, page_size)):
+                items.extend(page.get("value", []))
+
+        return items
 
-        return response.json().get("value", [])
+    def list_workspaces(self, refresh: bool = False) -> list:
+        """List all workspaces the user has access to (cached for the client's lifetime)"""
+        if self._workspaces is None or refresh:
+            self._workspaces = self._paged_get("/groups", "Failed to list workspaces")
+            self._ws_cache = None
+
+        return self._workspaces
 
     def get_workspace_id(self, workspace_name: str) -> Optional[str]:
         """Get workspace ID by name"""
-        workspaces = self.list_workspaces()
-
-        for ws in workspaces:
-            if ws["name"].lower() == workspace_name.lower():
-                return ws["id"]
+        if self._ws_cache is None:
+            self._ws_cache = {ws["name"].lower(): ws["id"] for ws in self.list_workspaces()}
 
-        return None
+        return self._ws_cache.get(workspace_name.lower())
 
     # -------------------------------------------------------------------------
     # Reports
@@ -133,7 +280,7 @@ class PowerBIClient:
         if response.status_code != 200:
             raise Exception(f"Failed to list reports: {response.text}")
 
-        return response.json().get("value", [])
+        return _json(response).get("value", [])
 
     def get_report(self, report_id: str, workspace_id: Optional[str] = None) -> Dict:
         """Get report details"""
@@ -147,7 +294,7 @@ class PowerBIClient:
         if response.status_code != 200:
             raise Exception(f"Failed to get report: {response.text}")
 
-        return response.json()
+        return _json(response)
 
     def delete_report(self, report_id: str, workspace_id: Optional[str] = None) -> bool:
         """Delete a report"""
@@ -186,13 +333,14 @@ class PowerBIClient:
         """
         pbix_path = Path(pbix_path)
 
-        if not pbix_path.exists():
-            raise FileNotFoundError(f"PBIX file not found: {pbix_path}")
+        try:
+            file_size = pbix_path.stat().st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"PBIX file not found: {pbix_path}") from None
 
         if not pbix_path.suffix.lower() == ".pbix":
             raise ValueError("File must be a .pbix file")
 
-        file_size = pbix_path.stat().st_size
         file_size_mb = file_size / (1024 * 1024)
 
         print(f"Uploading: {pbix_path.name} ({file_size_mb:.1f} MB)")
@@ -212,30 +360,53 @@ class PowerBIClient:
 
         # For files > 1GB, need to use temporary upload location
         if file_size_mb > 1024:
-            return self._import_large_pbix(pbix_path, dataset_name, workspace_id, name_conflict)
+            return self._import_large_pbix(pbix_path, file_size, dataset_name, workspace_id, name_conflict)
 
         # Standard upload for files < 1GB
-        url = f"{POWER_BI_API_BASE}{endpoint}"
-
-        headers = {
-            "Authorization": f"Bearer {self.auth.get_token()}"
-        }
-
-        with open(pbix_path, "rb") as f:
-            files = {"file": (pbix_path.name, f, "application/octet-stream")}
-            response = requests.post(url, headers=headers, params=params, files=files)
+        response = self._post_pbix(f"{POWER_BI_API_BASE}{endpoint}", pbix_path, params)
 
         if response.status_code not in [200, 201, 202]:
             raise Exception(f"Import failed ({response.status_code}): {response.text}")
 
-        import_info = response.json()
+        import_info = _json(response)
         print(f"Import started: {import_info.get('id', 'unknown')}")
 
         return import_info
 
+    def _post_pbix(self, url: str, pbix_path: Path, params: Dict[str, str]) -> requests.Response:
+        """POST a multipart PBIX upload, re-opening the file for each throttled retry"""
+        for attempt in range(POST_RETRIES + 1):
+            self.auth.ensure_fresh(self.session)
+
+            with open(pbix_path, "rb") as f:
+                if MultipartEncoder is not None:
+                    # Stream the multipart body from disk instead of buffering it
+                    # (an mmap can't be used here: toolbelt sizes it by len(), which never drains)
+                    encoder = MultipartEncoder(
+                        fields={"file": (pbix_path.name, f, "application/octet-stream")}
+                    )
+                    response = self.session.post(
+                        url,
+                        params=params,
+                        data=encoder,
+                        headers={"Content-Type": encoder.content_type},
+                        timeout=(10, 600)
+                    )
+                else:
+                    files = {"file": (pbix_path.name, f, "application/octet-stream")}
+                    response = self.session.post(url, params=params, files=files, timeout=(10, 600))
+
+            if response.status_code != 429 or attempt == POST_RETRIES:
+                return response
+
+            wait = _retry_after_seconds(response, 2.0 * (attempt + 1))
+            print(f"  Rate limited, retrying upload in {wait:.0f}s...")
+            time.sleep(wait)
+
     def _import_large_pbix(
         self,
         pbix_path: Path,
+        file_size: int,
         dataset_name: str,
         workspace_id: Optional[str],
         name_conflict: str
@@ -253,23 +424,12 @@ class PowerBIClient:
         if response.status_code != 200:
             raise Exception(f"Failed to create upload location: {response.text}")
 
-        upload_url = response.json()["url"]
+        upload_url = _json(response)["url"]
 
         # Step 2: Upload file to blob storage
         print("Uploading to temporary storage...")
 
-        with open(pbix_path, "rb") as f:
-            blob_response = requests.put(
-                upload_url,
-                data=f,
-                headers={
-                    "x-ms-blob-type": "BlockBlob",
-                    "Content-Type": "application/octet-stream"
-                }
-            )
-
-        if blob_response.status_code not in [200, 201]:
-            raise Exception(f"Blob upload failed: {blob_response.text}")
+        self._upload_blob_blocks(upload_url, pbix_path, file_size)
 
         # Step 3: Start import from blob
         if workspace_id:
@@ -289,7 +449,52 @@ class PowerBIClient:
         if response.status_code not in [200, 201, 202]:
             raise Exception(f"Import from blob failed: {response.text}")
 
-        return response.json()
+        return _json(response)
+
+    def _upload_blob_blocks(self, upload_url: str, pbix_path: Path, file_size: int):
+        """Upload a file to a SAS blob URL as parallel blocks, then commit them"""
+        offsets = range(0, file_size, BLOB_BLOCK_SIZE)
+        block_ids = [base64.b64encode(uuid.uuid4().bytes).decode() for _ in offsets]
+
+        # SAS URL carries its own auth; don't send the Power BI token
+        blob_headers = {"Authorization": None}
+
+        with open(pbix_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+
+            def put_block(block):
+                block_id, offset = block
+                try:
+                    response = self.session.put(
+                        upload_url,
+                        params={"comp": "block", "blockid": block_id},
+                        data=view[offset:offset + BLOB_BLOCK_SIZE],
+                        headers=blob_headers
+                    )
+                except requests.RequestException as e:
+                    return str(e)
+                # Return plain values so no slice of the mapping outlives the upload
+                if response.status_code != 201:
+                    return response.text
+                return None
+
+            with ThreadPoolExecutor(max_workers=BLOB_UPLOAD_WORKERS) as executor:
+                errors = [e for e in executor.map(put_block, zip(block_ids, offsets)) if e]
+
+        if errors:
+            raise Exception(f"Blob upload failed: {errors[0]}")
+
+        block_list = "".join(f"<Latest>{block_id}</Latest>" for block_id in block_ids)
+        response = self.session.put(
+            upload_url,
+            params={"comp": "blocklist"},
+            data=f'<?xml version="1.0" encoding="utf-8"?><BlockList>{block_list}</BlockList>',
+            headers={**blob_headers, "Content-Type": "application/xml"}
+        )
+
+        if response.status_code != 201:
+            raise Exception(f"Blob commit failed: {response.text}")
 
     def get_import_status(self, import_id: str, workspace_id: Optional[str] = None) -> Dict:
         """Check the status of an import operation"""
@@ -303,30 +508,36 @@ class PowerBIClient:
         if response.status_code != 200:
             raise Exception(f"Failed to get import status: {response.text}")
 
-        return response.json()
+        return _json(response)
 
     def wait_for_import(
         self,
         import_id: str,
         workspace_id: Optional[str] = None,
         timeout: int = 300,
-        poll_interval: int = 5
+        max_poll_interval: float = 30.0
     ) -> Dict:
-        """Wait for import to complete"""
+        """Wait for import to complete, backing off between polls"""
         start_time = time.time()
+        delay = 1.0
+        last_state = None
 
         while time.time() - start_time < timeout:
             status = self.get_import_status(import_id, workspace_id)
             import_state = status.get("importState", "Unknown")
 
-            print(f"  Import status: {import_state}")
+            if import_state != last_state:
+                print(f"  Import status: {import_state}")
+                last_state = import_state
 
             if import_state == "Succeeded":
                 return status
             elif import_state == "Failed":
                 raise Exception(f"Import failed: {status}")
 
-            time.sleep(poll_interval)
+            remaining = timeout - (time.time() - start_time)
+            time.sleep(max(0.0, min(delay, remaining)))
+            delay = _next_poll_delay(delay, max_poll_interval)
 
         raise TimeoutError(f"Import timed out after {timeout} seconds")
 
@@ -346,7 +557,7 @@ class PowerBIClient:
         if response.status_code != 200:
             raise Exception(f"Failed to list datasets: {response.text}")
 
-        return response.json().get("value", [])
+        return _json(response).get("value", [])
 
     def refresh_dataset(self, dataset_id: str, workspace_id: Optional[str] = None) -> bool:
         """Trigger a dataset refresh"""
@@ -358,6 +569,166 @@ class PowerBIClient:
         response = self._request("POST", endpoint)
         return response.status_code == 202
 
+# =============================================================================
+# ASYNC POWER BI CLIENT
+# =============================================================================
+
+class AsyncPowerBIClient:
+    """Async Power BI client for publishing several PBIX files concurrently
+
+    Requests are multiplexed over a single HTTP/2 connection when the h2
+    package is installed. Files over 1GB must go through PowerBIClient.
+    """
+
+    def __init__(self, auth: PowerBIAuth):
+        if httpx is None:
+            raise ImportError("AsyncPowerBIClient requires httpx: pip install 'httpx[http2]'")
+
+        self.auth = auth
+        self.client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            timeout=httpx.Timeout(30.0, read=600.0, write=600.0)
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """Release pooled connections"""
+        await self.client.aclose()
+
+    async def _request(self, method: str, endpoint: str, max_retries: int = 6, **kwargs) -> "httpx.Response":
+        """Make authenticated request to Power BI API, retrying throttling and transient 5xx
+
+        httpx has no status retries, so this mirrors the sync session's policy:
+        429 is retried for any method, 5xx only for idempotent ones.
+        """
+        url = f"{POWER_BI_API_BASE}{endpoint}"
+
+        for attempt in range(max_retries + 1):
+            # A token refresh is a blocking requests call - keep it off the event loop,
+            # but only hop to a thread when one is actually due
+            if time.monotonic() >= self.auth._deadline:
+                await asyncio.get_running_loop().run_in_executor(None, self.auth.ensure_fresh, self.client)
+            else:
+                self.auth.ensure_fresh(self.client)
+            response = await self.client.request(method, url, **kwargs)
+
+            retryable = response.status_code == 429 or (
+                response.status_code in RETRY_STATUS_CODES and method in ("GET", "PUT", "DELETE")
+            )
+            if not retryable or attempt == max_retries:
+                return response
+
+            await asyncio.sleep(_retry_after_seconds(response, 2.0 ** attempt))
+
+    async def import_pbix(
+        self,
+        pbix_path: str,
+        dataset_name: str,
+        workspace_id: Optional[str] = None,
+        name_conflict: str = "CreateOrOverwrite",
+        skip_report: bool = False
+    ) -> Dict[str, Any]:
+        """Import a PBIX file to Power BI Service (see PowerBIClient.import_pbix)"""
+        pbix_path = Path(pbix_path)
+
+        try:
+            file_size = pbix_path.stat().st_size
+        except FileNotFoundError:
+            raise FileNotFoundError(f"PBIX file not found: {pbix_path}") from None
+
+        if not pbix_path.suffix.lower() == ".pbix":
+            raise ValueError("File must be a .pbix file")
+
+        file_size_mb = file_size / (1024 * 1024)
+
+        if file_size_mb > 1024:
+            raise ValueError(f"{pbix_path.name} is over 1GB; publish it on its own")
+
+        print(f"Uploading: {pbix_path.name} ({file_size_mb:.1f} MB)")
+
+        if workspace_id:
+            endpoint = f"/groups/{workspace_id}/imports"
+        else:
+            endpoint = "/imports"
+
+        params = {
+            "datasetDisplayName": dataset_name,
+            "nameConflict": name_conflict,
+            "skipReport": str(skip_report).lower()
+        }
+
+        for attempt in range(POST_RETRIES + 1):
+            # Re-open the file for each attempt so a throttled upload is resent in full
+            with open(pbix_path, "rb") as f:
+                files = {"file": (pbix_path.name, f, "application/octet-stream")}
+                response = await self._request("POST", endpoint, max_retries=0, params=params, files=files)
+
+            if response.status_code != 429 or attempt == POST_RETRIES:
+                break
+
+            wait = _retry_after_seconds(response, 2.0 * (attempt + 1))
+            print(f"  Rate limited, retrying {pbix_path.name} in {wait:.0f}s...")
+            await asyncio.sleep(wait)
+
+        if response.status_code not in [200, 201, 202]:
+            raise Exception(f"Import failed ({response.status_code}): {response.text}")
+
+        import_info = _json(response)
+        print(f"Import started: {import_info.get('id', 'unknown')}")
+
+        return import_info
+
+    async def get_import_status(self, import_id: str, workspace_id: Optional[str] = None) -> Dict:
+        """Check the status of an import operation"""
+        if workspace_id:
+            endpoint = f"/groups/{workspace_id}/imports/{import_id}"
+        else:
+            endpoint = f"/imports/{import_id}"
+
+        response = await self._request("GET", endpoint)
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to get import status: {response.text}")
+
+        return _json(response)
+
+    async def wait_for_import(
+        self,
+        import_id: str,
+        workspace_id: Optional[str] = None,
+        timeout: int = 300,
+        max_poll_interval: float = 30.0
+    ) -> Dict:
+        """Wait for import to complete, backing off between polls"""
+        start_time = time.time()
+        delay = 1.0
+        last_state = None
+
+        while time.time() - start_time < timeout:
+            status = await self.get_import_status(import_id, workspace_id)
+            import_state = status.get("importState", "Unknown")
+
+            if import_state != last_state:
+                print(f"  Import status ({import_id}): {import_state}")
+                last_state = import_state
+
+            if import_state == "Succeeded":
+                return status
+            elif import_state == "Failed":
+                raise Exception(f"Import failed: {status}")
+
+            remaining = timeout - (time.time() - start_time)
+            await asyncio.sleep(max(0.0, min(delay, remaining)))
+            delay = _next_poll_delay(delay, max_poll_interval)
+
+        raise TimeoutError(f"Import timed out after {timeout} seconds")
+
 # =============================================================================
 # CLI
 # =============================================================================
@@ -370,87 +741,82 @@ def load_config(config_path: str = None) -> Dict[str, str]:
         "client_secret": os.environ.get("POWERBI_CLIENT_SECRET", "")
     }
 
+    # Environment is complete and no file was asked for - no need to touch the filesystem
+    # (an explicit --config still overrides the environment)
+    if config_path is None and all(config.values()):
+        return config
+
     # Try loading from config file
-    if config_path and Path(config_path).exists():
-        with open(config_path) as f:
-            file_config = json.load(f)
-            config.update(file_config)
-    elif Path("powerbi_config.json").exists():
-        with open("powerbi_config.json") as f:
-            file_config = json.load(f)
-            config.update(file_config)
+    for path in (config_path, "powerbi_config.json"):
+        if not path:
+            continue
+        try:
+            with open(path, "rb") as f:
+                config.update(_loads(f.read()))
+            break
+        except FileNotFoundError:
+            continue
 
     return config
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Publish Power BI reports (.pbix) to Power BI Service"
-    )
-
-    parser.add_argument(
-        "--pbix", "-p",
-        required=True,
-        help="Path to the .pbix file to publish"
-    )
+async def publish_many(
+    auth: PowerBIAuth,
+    pbix_paths: List[str],
+    workspace_id: Optional[str],
+    args: argparse.Namespace
+) -> bool:
+    """Publish several PBIX files concurrently; returns True if all succeeded"""
 
-    parser.add_argument(
-        "--name", "-n",
-        help="Display name for the report/dataset (default: filename)"
-    )
-
-    parser.add_argument(
-        "--workspace", "-w",
-        help="Target workspace name"
-    )
+    async def publish_one(client: AsyncPowerBIClient, pbix_path: Path) -> Dict:
+        import_result = await client.import_pbix(
+            pbix_path=str(pbix_path),
+            dataset_name=pbix_path.stem,
+            workspace_id=workspace_id,
+            name_conflict=args.conflict
+        )
 
-    parser.add_argument(
-        "--workspace-id",
-        help="Target workspace ID (alternative to --workspace)"
-    )
+        import_id = import_result.get("id")
+        if not (args.wait and import_id):
+            return import_result
 
-    parser.add_argument(
-        "--conflict",
-        choices=["CreateOrOverwrite", "Abort", "Overwrite", "Ignore"],
-        default="CreateOrOverwrite",
-        help="How to handle naming conflicts (default: CreateOrOverwrite)"
-    )
+        return await client.wait_for_import(
+            import_id=import_id,
+            workspace_id=workspace_id,
+            timeout=args.timeout
+        )
 
-    parser.add_argument(
-        "--config", "-c",
-        help="Path to config JSON file"
-    )
+    paths = [Path(p) for p in pbix_paths]
 
-    parser.add_argument(
-        "--list-workspaces",
-        action="store_true",
-        help="List available workspaces and exit"
-    )
+    print(f"\n{'='*60}")
+    print(f"Power BI Publisher ({len(paths)} files)")
+    print(f"{'='*60}")
+    for pbix_path in paths:
+        print(f"File: {pbix_path}")
+    print(f"Workspace: {args.workspace or 'My Workspace'}")
+    print(f"Conflict: {args.conflict}")
+    print(f"{'='*60}\n")
 
-    parser.add_argument(
-        "--list-reports",
-        action="store_true",
-        help="List reports in workspace and exit"
-    )
+    async with AsyncPowerBIClient(auth) as client:
+        results = await asyncio.gather(
+            *(publish_one(client, pbix_path) for pbix_path in paths),
+            return_exceptions=True
+        )
 
-    parser.add_argument(
-        "--wait",
-        action="store_true",
-        default=True,
-        help="Wait for import to complete (default: True)"
-    )
+    print(f"\n{'='*60}")
+    for pbix_path, result in zip(paths, results):
+        if isinstance(result, Exception):
+            print(f"FAILED     {pbix_path.name}: {result}")
+        else:
+            print(f"{result.get('importState', 'Started'):<10} {pbix_path.name}")
+    print(f"{'='*60}")
 
-    parser.add_argument(
-        "--timeout",
-        type=int,
-        default=300,
-        help="Timeout in seconds when waiting for import (default: 300)"
-    )
+    return not any(isinstance(result, Exception) for result in results)
 
-    args = parser.parse_args()
 
-    # Load configuration
-    config = load_config(args.config)
+def get_client(config_path: Optional[str] = None) -> PowerBIClient:
+    """Build an authenticated client from config, exiting if credentials are missing"""
+    config = load_config(config_path)
 
     # Validate config
     missing = [k for k in ["tenant_id", "client_id", "client_secret"] if not config.get(k)]
@@ -462,106 +828,221 @@ def main():
         print("  POWERBI_CLIENT_SECRET")
         sys.exit(1)
 
-    # Initialize client
     auth = PowerBIAuth(
         tenant_id=config["tenant_id"],
         client_id=config["client_id"],
         client_secret=config["client_secret"]
     )
 
-    client = PowerBIClient(auth)
+    return PowerBIClient(auth)
 
-    # List workspaces mode
-    if args.list_workspaces:
-        print("\nAvailable Workspaces:")
-        print("-" * 50)
-        for ws in client.list_workspaces():
-            print(f"  {ws['name']}")
-            print(f"    ID: {ws['id']}")
-        return
 
-    # Resolve workspace ID
+def _add_config_argument(parser: argparse.ArgumentParser, default=None):
+    """Add the --config option (also accepted after the subcommand)"""
+    parser.add_argument(
+        "--config", "-c",
+        default=default,
+        help="Path to config JSON file"
+    )
+
+
+def _add_workspace_arguments(parser: argparse.ArgumentParser):
+    """Add the --workspace / --workspace-id options to a subcommand"""
+    parser.add_argument(
+        "--workspace", "-w",
+        help="Target workspace name"
+    )
+
+    parser.add_argument(
+        "--workspace-id",
+        help="Target workspace ID (alternative to --workspace)"
+    )
+
+
+def _resolve_workspace_id(client: PowerBIClient, args: argparse.Namespace) -> Optional[str]:
+    """Resolve --workspace / --workspace-id to an ID, exiting if the name is unknown"""
     workspace_id = args.workspace_id
     if args.workspace and not workspace_id:
+        workspaces = client.list_workspaces()
         workspace_id = client.get_workspace_id(args.workspace)
         if not workspace_id:
             print(f"Error: Workspace '{args.workspace}' not found")
             print("\nAvailable workspaces:")
-            for ws in client.list_workspaces():
+            for ws in workspaces:
                 print(f"  - {ws['name']}")
             sys.exit(1)
 
-    # List reports mode
-    if args.list_reports:
-        print(f"\nReports in workspace:")
-        print("-" * 50)
-        for report in client.list_reports(workspace_id):
-            print(f"  {report['name']}")
-            print(f"    ID: {report['id']}")
-        return
+    return workspace_id
 
-    # Publish mode
-    pbix_path = Path(args.pbix)
-    dataset_name = args.name or pbix_path.stem
 
-    print(f"\n{'='*60}")
-    print(f"Power BI Publisher")
-    print(f"{'='*60}")
-    print(f"File: {pbix_path}")
-    print(f"Name: {dataset_name}")
-    print(f"Workspace: {args.workspace or 'My Workspace'}")
-    print(f"Conflict: {args.conflict}")
-    print(f"{'='*60}\n")
+def main():
+    parser = argparse.ArgumentParser(
+        description="Publish Power BI reports (.pbix) to Power BI Service"
+    )
 
-    try:
-        # Import the PBIX
-        import_result = client.import_pbix(
-            pbix_path=str(pbix_path),
-            dataset_name=dataset_name,
-            workspace_id=workspace_id,
-            name_conflict=args.conflict
-        )
+    _add_config_argument(parser)
 
-        import_id = import_result.get("id")
+    subparsers = parser.add_subparsers(dest="cmd", required=True)
 
-        if args.wait and import_id:
-            print("\nWaiting for import to complete...")
-            final_status = client.wait_for_import(
-                import_id=import_id,
-                workspace_id=workspace_id,
-                timeout=args.timeout
-            )
+    # list-workspaces
+    list_workspaces_parser = subparsers.add_parser(
+        "list-workspaces",
+        help="List available workspaces"
+    )
+    # SUPPRESS keeps a --config given before the subcommand from being reset
+    _add_config_argument(list_workspaces_parser, argparse.SUPPRESS)
 
-            print(f"\n{'='*60}")
-            print("IMPORT SUCCESSFUL!")
-            print(f"{'='*60}")
+    # list-reports
+    list_reports_parser = subparsers.add_parser(
+        "list-reports",
+        help="List reports in a workspace"
+    )
+    _add_config_argument(list_reports_parser, argparse.SUPPRESS)
+    _add_workspace_arguments(list_reports_parser)
 
-            # Print report info
-            reports = final_status.get("reports", [])
-            datasets = final_status.get("datasets", [])
+    # publish
+    publish_parser = subparsers.add_parser(
+        "publish",
+        help="Publish .pbix file(s)"
+    )
+    _add_config_argument(publish_parser, argparse.SUPPRESS)
 
-            if reports:
-                print(f"\nReport: {reports[0].get('name')}")
-                print(f"  ID: {reports[0].get('id')}")
-                report_id = reports[0].get('id')
-                if workspace_id:
-                    print(f"  URL: https://app.powerbi.com/groups/{workspace_id}/reports/{report_id}")
-                else:
-                    print(f"  URL: https://app.powerbi.com/reports/{report_id}")
+    publish_parser.add_argument(
+        "--pbix", "-p",
+        required=True,
+        nargs="+",
+        help="Path to the .pbix file(s) to publish; several files are published concurrently"
+    )
 
-            if datasets:
-                print(f"\nDataset: {datasets[0].get('name')}")
-                print(f"  ID: {datasets[0].get('id')}")
+    publish_parser.add_argument(
+        "--name", "-n",
+        help="Display name for the report/dataset (default: filename)"
+    )
 
-        else:
-            print(f"\nImport started: {import_id}")
-            print("Use --wait to wait for completion")
+    _add_workspace_arguments(publish_parser)
 
-        print("\nDone!")
+    publish_parser.add_argument(
+        "--conflict",
+        choices=["CreateOrOverwrite", "Abort", "Overwrite", "Ignore"],
+        default="CreateOrOverwrite",
+        help="How to handle naming conflicts (default: CreateOrOverwrite)"
+    )
 
-    except Exception as e:
-        print(f"\nError: {e}")
-        sys.exit(1)
+    publish_parser.add_argument(
+        "--wait",
+        action="store_true",
+        default=True,
+        help="Wait for import to complete (default: True)"
+    )
+
+    publish_parser.add_argument(
+        "--timeout",
+        type=int,
+        default=300,
+        help="Timeout in seconds when waiting for import (default: 300)"
+    )
+
+    args = parser.parse_args()
+
+    if args.cmd == "publish" and args.name and len(args.pbix) > 1:
+        publish_parser.error("--name can only be used with a single --pbix file")
+
+    with get_client(args.config) as client:
+
+        # List workspaces mode
+        if args.cmd == "list-workspaces":
+            print("\nAvailable Workspaces:")
+            print("-" * 50)
+            for ws in client.list_workspaces():
+                print(f"  {ws['name']}")
+                print(f"    ID: {ws['id']}")
+            return
+
+        workspace_id = _resolve_workspace_id(client, args)
+
+        # List reports mode
+        if args.cmd == "list-reports":
+            print(f"\nReports in workspace:")
+            print("-" * 50)
+            for report in client.list_reports(workspace_id):
+                print(f"  {report['name']}")
+                print(f"    ID: {report['id']}")
+            return
+
+        # Publish mode (several files)
+        if len(args.pbix) > 1:
+            try:
+                succeeded = asyncio.run(publish_many(client.auth, args.pbix, workspace_id, args))
+            except ImportError as e:  # httpx isn't installed
+                print(f"\nError: {e}")
+                sys.exit(1)
+            if not succeeded:
+                sys.exit(1)
+            print("\nDone!")
+            return
+
+        # Publish mode
+        pbix_path = Path(args.pbix[0])
+        dataset_name = args.name or pbix_path.stem
+
+        print(f"\n{'='*60}")
+        print(f"Power BI Publisher")
+        print(f"{'='*60}")
+        print(f"File: {pbix_path}")
+        print(f"Name: {dataset_name}")
+        print(f"Workspace: {args.workspace or 'My Workspace'}")
+        print(f"Conflict: {args.conflict}")
+        print(f"{'='*60}\n")
+
+        try:
+            # Import the PBIX
+            import_result = client.import_pbix(
+                pbix_path=str(pbix_path),
+                dataset_name=dataset_name,
+                workspace_id=workspace_id,
+                name_conflict=args.conflict
+            )
+
+            import_id = import_result.get("id")
+
+            if args.wait and import_id:
+                print("\nWaiting for import to complete...")
+                final_status = client.wait_for_import(
+                    import_id=import_id,
+                    workspace_id=workspace_id,
+                    timeout=args.timeout
+                )
+
+                print(f"\n{'='*60}")
+                print("IMPORT SUCCESSFUL!")
+                print(f"{'='*60}")
+
+                # Print report info
+                reports = final_status.get("reports", [])
+                datasets = final_status.get("datasets", [])
+
+                if reports:
+                    print(f"\nReport: {reports[0].get('name')}")
+                    print(f"  ID: {reports[0].get('id')}")
+                    report_id = reports[0].get('id')
+                    if workspace_id:
+                        print(f"  URL: https://app.powerbi.com/groups/{workspace_id}/reports/{report_id}")
+                    else:
+                        print(f"  URL: https://app.powerbi.com/reports/{report_id}")
+
+                if datasets:
+                    print(f"\nDataset: {datasets[0].get('name')}")
+                    print(f"  ID: {datasets[0].get('id')}")
+
+            else:
+                print(f"\nImport started: {import_id}")
+                print("Use --wait to wait for completion")
+
+            print("\nDone!")
+
+        except Exception as e:
+            print(f"\nError: {e}")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
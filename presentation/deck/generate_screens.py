@@ -1,8 +1,7 @@
 import os
-import re
 
-# Read the main HTML file
-with open('/Users/Morpheous/vltrndataroom/DotDesignPop_PowerBI_Project/presentation/DotDesignPop_Presentation.html', 'r') as f:
+# Read the main HTML file as bytes - pages are written back without re-encoding
+with open('/Users/Morpheous/vltrndataroom/DotDesignPop_PowerBI_Project/presentation/DotDesignPop_Presentation.html', 'rb') as f:
     html_content = f.read()
 
 pages = [
@@ -12,39 +11,34 @@ pages = [
     {'name': '04_Warranty', 'tab': 'warranty', 'url': 'https://app.powerbi.com/saintjames/coolers/warranty-service'},
 ]
 
+DEFAULT_URL = b'https://app.powerbi.com/saintjames/coolers/dashboard'
+
 deck_dir = '/Users/Morpheous/vltrndataroom/DotDesignPop_PowerBI_Project/presentation/deck'
 
+# Build the template once - nothing active, then activate per page below
+template = html_content.replace(b'class="nav-tab active"', b'class="nav-tab"')
+template = template.replace(b'class="page active"', b'class="page"')
+
 for page in pages:
-    modified = html_content
-    
-    # Update nav tabs - remove active from all, add to current
-    modified = re.sub(r'class="nav-tab active"', 'class="nav-tab"', modified)
-    modified = re.sub(
-        rf'class="nav-tab" data-tab="{page["tab"]}"',
-        f'class="nav-tab active" data-tab="{page["tab"]}"',
-        modified
+    # Activate the current nav tab and page
+    tab = page['tab'].encode('utf-8')
+    modified = template.replace(
+        b'class="nav-tab" data-tab="' + tab + b'"',
+        b'class="nav-tab active" data-tab="' + tab + b'"'
     )
-    
-    # Update pages - remove active from all, add to current
-    modified = re.sub(r'class="page active"', 'class="page"', modified)
-    modified = re.sub(
-        rf'class="page" id="page-{page["tab"]}"',
-        f'class="page active" id="page-{page["tab"]}"',
-        modified
+    modified = modified.replace(
+        b'class="page" id="page-' + tab + b'"',
+        b'class="page active" id="page-' + tab + b'"'
     )
-    
+
     # Update URL display
-    modified = re.sub(
-        r'https://app\.powerbi\.com/saintjames/coolers/dashboard',
-        page['url'],
-        modified
-    )
-    
+    modified = modified.replace(DEFAULT_URL, page['url'].encode('utf-8'))
+
     # Write the modified HTML
     output_path = os.path.join(deck_dir, f'{page["name"]}.html')
-    with open(output_path, 'w') as f:
+    with open(output_path, 'wb') as f:
         f.write(modified)
-    
+
     print(f'Created: {output_path}')
 
 print('Done creating HTML files!')
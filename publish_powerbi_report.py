@@ -7,6 +7,7 @@ Requires Azure AD App Registration with Power BI API permissions.
 
 Usage:
     python publish_powerbi_report.py --file report.pbix --workspace "Production Reports"
+    python publish_powerbi_report.py --file sales.pbix ops.pbix --workspace "Production Reports"
 
 Prerequisites:
     - Azure AD App with Power BI API permissions (Dataset.ReadWrite.All, Workspace.ReadWrite.All)
@@ -14,22 +15,47 @@ Prerequisites:
 """
 
 import os
+import importlib.util
+import inspect
 import sys
+import re
 import argparse
 import logging
 import time
+import difflib
 from pathlib import Path
-from datetime import datetime
-from typing import Optional, Dict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, List
 
 try:
     import requests
-    from msal import ConfidentialClientApplication
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from msal import ConfidentialClientApplication, SerializableTokenCache
 except ImportError:
     print("ERROR: Required packages not installed.")
     print("Install with: pip install requests msal")
     sys.exit(1)
 
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
+except ImportError:  # Fall back to requests' in-memory multipart body
+    MultipartEncoder = None
+
+try:
+    import httpx
+except ImportError:  # API calls stay on the requests session
+    httpx = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # Fall back to the stdlib parser
+    import json
+    _loads = json.loads
+
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -38,18 +64,96 @@ except ImportError:
 POWER_BI_API_BASE = "https://api.powerbi.com/v1.0/myorg"
 POWER_BI_SCOPE = ["https://analysis.windows.net/powerbi/api/.default"]
 
-# Logging setup
-LOG_FILE = f"powerbi_publish_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] [%(levelname)s] %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# Import status polling: pending polls are matched with these instead of a full JSON parse
+IMPORT_STATE_RE = re.compile(rb'"importState"\s*:\s*"(\w+)"')
+IMPORT_PROGRESS_RE = re.compile(rb'"progress"\s*:\s*([\d.]+)')
+PENDING_IMPORT_STATES = ('Publishing', 'Importing')
+
+# MSAL token cache shared across runs (tokens are reused until they expire)
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "pbi_publisher_token.bin"
+
+# Seconds to reuse the workspace list when /groups sends no ETag
+WORKSPACE_CACHE_TTL = 300
+
+# Throttling/5xx statuses retried on idempotent API calls
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
 logger = logging.getLogger(__name__)
 
+
+def setup_logging() -> Optional[str]:
+    """Configure console and file logging for a script run, returning the log file path
+
+    Safe to call more than once: if logging is already configured it is left alone
+    and its existing log file (if any) is returned.
+    """
+    if logging.getLogger().handlers:
+        return _active_log_file()
+
+    log_file = f"powerbi_publish_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    logging.basicConfig(
+        level=logging.INFO,
+        format='[%(asctime)s] [%(levelname)s] %(message)s',
+        handlers=[
+            logging.FileHandler(log_file),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    # httpx logs every request at INFO; keep import polls out of the console and log file
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    return _active_log_file()
+
+
+def _active_log_file() -> Optional[str]:
+    """Path of the root logger's log file, if logging was configured with one"""
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.FileHandler):
+            return handler.baseFilename
+    return None
+
+
+def _retry_after_seconds(response, default: float) -> float:
+    """Parse a Retry-After header given as seconds or as an HTTP date"""
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return default
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return default
+
+
+def _stat_pbix(pbix_path: Path) -> os.stat_result:
+    """Validate a .pbix path and return its stat result with a single syscall"""
+    if pbix_path.suffix.casefold() != '.pbix':
+        raise ValueError(f"File must be a .pbix file: {pbix_path}")
+
+    try:
+        return pbix_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {pbix_path}") from None
+
+
+def _upload_progress_logger(name: str, total_bytes: int):
+    """Return a MultipartEncoderMonitor callback that logs every 10% of name uploaded"""
+    step = max(total_bytes // 10, 1)
+    next_mark = step
+
+    def callback(monitor):
+        nonlocal next_mark
+        if monitor.bytes_read >= next_mark:
+            logger.info("  %s: uploaded %.1f MB of %.1f MB", name,
+                        monitor.bytes_read / (1024 * 1024), total_bytes / (1024 * 1024))
+            next_mark = (monitor.bytes_read // step + 1) * step
+
+    return callback
+
 # ============================================================================
 # AUTHENTICATION
 # ============================================================================
@@ -87,13 +191,16 @@ class PowerBIAuthenticator:
 
         try:
             authority = f"https://login.microsoftonline.com/{self.tenant_id}"
+            cache = load_token_cache()
             app = ConfidentialClientApplication(
                 client_id=self.client_id,
                 client_credential=self.client_secret,
-                authority=authority
+                authority=authority,
+                token_cache=cache
             )
 
             result = app.acquire_token_for_client(scopes=POWER_BI_SCOPE)
+            save_token_cache(cache)
 
             if "access_token" not in result:
                 error_msg = result.get("error_description", result.get("error", "Unknown error"))
@@ -107,6 +214,33 @@ class PowerBIAuthenticator:
             logger.error(f"Authentication failed: {str(e)}")
             raise
 
+
+def load_token_cache() -> SerializableTokenCache:
+    """Load the persisted MSAL token cache, starting empty if missing or unreadable"""
+    cache = SerializableTokenCache()
+    try:
+        cache.deserialize(TOKEN_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        pass
+    return cache
+
+
+def save_token_cache(cache: SerializableTokenCache):
+    """Persist the MSAL token cache (owner read/write only) if it changed"""
+    if not cache.has_state_changed:
+        return
+
+    try:
+        TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # The mode above only applies on creation; tighten a pre-existing file too
+        if hasattr(os, 'fchmod'):
+            os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(cache.serialize())
+    except OSError as e:
+        logger.warning(f"Could not save token cache: {str(e)}")
+
 # ============================================================================
 # POWER BI OPERATIONS
 # ============================================================================
@@ -120,20 +254,109 @@ class PowerBIPublisher:
             "Authorization": f"Bearer {access_token}",
             "Content-Type": "application/json"
         }
+        self._workspace_cache: Optional[Dict[str, Dict]] = None
+        self._groups_etag: Optional[str] = None
+        self._groups_fetched_at = 0.0
+
+        # Keep-alive session so every call reuses the same TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Idempotent calls retry throttling/5xx with jittered exponential backoff;
+        # the multipart POST can't be replayed by urllib3, see _post_file
+        retry_options = dict(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "PUT"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        # backoff_jitter was added in urllib3 2.0; 1.26 backs off without it
+        if 'backoff_jitter' in inspect.signature(Retry).parameters:
+            retry_options['backoff_jitter'] = 0.3
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(**retry_options)
+        ))
+
+        # With httpx[http2] installed, API calls (workspace lookup, import polling)
+        # share one multiplexed HTTP/2 connection; uploads stay on the session above
+        self.client = None
+        if httpx is not None and importlib.util.find_spec("h2") is not None:
+            self.client = httpx.Client(
+                http2=True,
+                base_url=POWER_BI_API_BASE,
+                headers=self.headers,
+                timeout=httpx.Timeout(connect=10, read=600, write=600, pool=5),
+                limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.client is not None:
+            self.client.close()
+        self.session.close()
+
+    def _make_request(self, method: str, endpoint: str, max_retries: int = 5, **kwargs):
+        """Make authenticated API request over HTTP/2 when available, else the pooled session"""
+        if self.client is None:
+            # Retries are handled by the session adapter
+            return self.session.request(method, f"{POWER_BI_API_BASE}/{endpoint}", **kwargs)
+
+        # httpx has no status or read retries, so mirror the adapter's policy for idempotent calls
+        retry_delay = 0.5
+        idempotent = method in ("GET", "PUT")
+        for attempt in range(max_retries + 1):
+            try:
+                response = self.client.request(method, endpoint, **kwargs)
+            except httpx.TransportError as e:
+                if not idempotent or attempt == max_retries:
+                    raise
+                logger.debug("%s %s failed (%s), retrying", method, endpoint, e)
+                time.sleep(retry_delay * (2 ** attempt))
+                continue
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """Make authenticated API request with retry logic"""
-        url = f"{POWER_BI_API_BASE}/{endpoint}"
-        max_retries = 3
+            if response.status_code not in RETRY_STATUS_CODES or not idempotent or attempt == max_retries:
+                return response
+            time.sleep(_retry_after_seconds(response, retry_delay * (2 ** attempt)))
+
+    def _post_file(self, url: str, pbix_path: Path, params: Dict, headers: Dict,
+                   max_retries: int = 3) -> requests.Response:
+        """POST a multipart file upload, re-opening the file for each retry"""
         retry_delay = 2
 
         for attempt in range(max_retries):
             try:
-                response = requests.request(method, url, headers=self.headers, **kwargs)
-
-                if response.status_code == 429:  # Rate limited
-                    wait_time = int(response.headers.get('Retry-After', retry_delay * (attempt + 1)))
-                    logger.warning(f"Rate limited. Waiting {wait_time} seconds...")
+                with open(pbix_path, 'rb') as file:
+                    if MultipartEncoder is not None:
+                        # Stream the body from disk, logging progress as it goes
+                        encoder = MultipartEncoder(
+                            fields={'file': (pbix_path.name, file, 'application/octet-stream')}
+                        )
+                        monitor = MultipartEncoderMonitor(encoder, _upload_progress_logger(pbix_path.name, encoder.len))
+                        response = self.session.post(
+                            url,
+                            params=params,
+                            headers={**headers, 'Content-Type': monitor.content_type},
+                            data=monitor,
+                            timeout=600  # 10 minute timeout for large files
+                        )
+                    else:
+                        files = {'file': (pbix_path.name, file, 'application/octet-stream')}
+                        response = self.session.post(
+                            url,
+                            params=params,
+                            headers=headers,
+                            files=files,
+                            timeout=600  # 10 minute timeout for large files
+                        )
+
+                if response.status_code == 429 and attempt < max_retries - 1:  # Rate limited
+                    wait_time = _retry_after_seconds(response, retry_delay * (attempt + 1))
+                    logger.warning(f"Rate limited. Waiting {wait_time:.0f} seconds...")
                     time.sleep(wait_time)
                     continue
 
@@ -142,78 +365,109 @@ class PowerBIPublisher:
             except requests.exceptions.RequestException as e:
                 if attempt == max_retries - 1:
                     raise
-                logger.warning(f"Request failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                logger.warning(f"Upload failed (attempt {attempt + 1}/{max_retries}): {str(e)}")
                 time.sleep(retry_delay * (attempt + 1))
 
         raise Exception("Max retries exceeded")
 
-    def get_workspace_id(self, workspace_name: str) -> str:
-        """Find workspace by name and return its ID"""
-        logger.info(f"Searching for workspace: {workspace_name}")
+    def _load_workspaces(self) -> Dict[str, Dict]:
+        """Fetch all workspaces, indexed by case-folded name
+
+        The index is revalidated with If-None-Match when the API sent an ETag,
+        otherwise it is reused for WORKSPACE_CACHE_TTL seconds.
+        """
+        headers = {}
+        if self._workspace_cache is not None:
+            if self._groups_etag:
+                headers["If-None-Match"] = self._groups_etag
+            elif time.monotonic() - self._groups_fetched_at < WORKSPACE_CACHE_TTL:
+                return self._workspace_cache
+
+        response = self._make_request("GET", "groups", params={"$top": 5000}, headers=headers)
 
-        response = self._make_request("GET", "groups")
+        if response.status_code == 304:
+            return self._workspace_cache
 
         if response.status_code != 200:
             raise Exception(f"Failed to retrieve workspaces: {response.text}")
 
-        workspaces = response.json().get("value", [])
+        workspaces = _loads(response.content).get("value", [])
+        self._workspace_cache = {workspace["name"].casefold(): workspace for workspace in workspaces}
+        self._groups_etag = response.headers.get("ETag")
+        self._groups_fetched_at = time.monotonic()
 
-        # Case-insensitive match
-        for workspace in workspaces:
-            if workspace["name"].lower() == workspace_name.lower():
-                workspace_id = workspace["id"]
-                logger.info(f"Found workspace: {workspace['name']} (ID: {workspace_id})")
-                return workspace_id
+        return self._workspace_cache
+
+    def get_workspace_id(self, workspace_name: str) -> str:
+        """Find workspace by name and return its ID"""
+        logger.info(f"Searching for workspace: {workspace_name}")
 
-        # List available workspaces
-        logger.warning("Available workspaces:")
-        for workspace in workspaces:
-            logger.warning(f"  - {workspace['name']} (ID: {workspace['id']})")
+        workspaces = self._load_workspaces()
+        target = workspace_name.casefold()
+
+        # Case-insensitive match
+        workspace = workspaces.get(target)
+        if workspace:
+            workspace_id = workspace["id"]
+            logger.info(f"Found workspace: {workspace['name']} (ID: {workspace_id})")
+            return workspace_id
+
+        # Suggest near misses, otherwise list a capped set of workspaces
+        suggestions = difflib.get_close_matches(target, workspaces.keys(), n=5)
+        if suggestions:
+            logger.warning("Did you mean:")
+            for name in suggestions:
+                logger.warning(f"  - {workspaces[name]['name']} (ID: {workspaces[name]['id']})")
+        else:
+            logger.warning("Available workspaces:")
+            for workspace in list(workspaces.values())[:20]:
+                logger.warning(f"  - {workspace['name']} (ID: {workspace['id']})")
+            if len(workspaces) > 20:
+                logger.warning(f"  ... and {len(workspaces) - 20} more")
 
         raise ValueError(f"Workspace '{workspace_name}' not found")
 
-    def publish_report(self, pbix_path: Path, workspace_id: str, report_name: Optional[str] = None) -> Dict:
-        """Publish PBIX file to Power BI workspace"""
+    def publish_report(self, pbix_path: Path, workspace_id: str, report_name: Optional[str] = None,
+                       stat_result: Optional[os.stat_result] = None) -> Dict:
+        """Publish PBIX file to Power BI workspace
 
-        if not pbix_path.exists():
-            raise FileNotFoundError(f"File not found: {pbix_path}")
+        Pass stat_result from an earlier pbix_path.stat() to skip re-statting the file.
+        """
 
-        if pbix_path.suffix.lower() != '.pbix':
-            raise ValueError(f"File must be a .pbix file: {pbix_path}")
+        if stat_result is None:
+            stat_result = _stat_pbix(pbix_path)
 
         # Use filename as report name if not specified
         if not report_name:
             report_name = pbix_path.stem
 
-        file_size_mb = pbix_path.stat().st_size / (1024 * 1024)
+        file_size_mb = stat_result.st_size / (1024 * 1024)
         logger.info(f"Publishing report...")
-        logger.info(f"  File: {pbix_path}")
-        logger.info(f"  Size: {file_size_mb:.2f} MB")
-        logger.info(f"  Report Name: {report_name}")
-        logger.info(f"  Workspace ID: {workspace_id}")
-
-        # Prepare multipart upload
-        with open(pbix_path, 'rb') as file:
-            files = {'file': (pbix_path.name, file, 'application/octet-stream')}
-
-            # Use import endpoint for PBIX upload
-            endpoint = f"groups/{workspace_id}/imports?datasetDisplayName={report_name}&nameConflict=CreateOrOverwrite"
-
-            # Override headers for multipart upload
-            upload_headers = {
-                "Authorization": f"Bearer {self.access_token}"
-            }
-
-            logger.info("Uploading file... (this may take several minutes for large files)")
-            response = requests.post(
-                f"{POWER_BI_API_BASE}/{endpoint}",
-                headers=upload_headers,
-                files=files,
-                timeout=600  # 10 minute timeout for large files
-            )
+        logger.info("  File: %s  Size: %.2f MB  Report Name: %s  Workspace ID: %s",
+                    pbix_path, file_size_mb, report_name, workspace_id)
+
+        # Use import endpoint for PBIX upload
+        endpoint = f"groups/{workspace_id}/imports"
+        params = {
+            "datasetDisplayName": report_name,
+            "nameConflict": "CreateOrOverwrite"
+        }
+
+        # Drop the session's JSON Content-Type so requests sets the multipart boundary
+        upload_headers = {
+            "Content-Type": None
+        }
+
+        logger.info("Uploading file... (this may take several minutes for large files)")
+        response = self._post_file(
+            f"{POWER_BI_API_BASE}/{endpoint}",
+            pbix_path,
+            params,
+            upload_headers
+        )
 
         if response.status_code not in [200, 202]:
-            error_msg = response.json().get('error', {}).get('message', response.text)
+            error_msg = _loads(response.content).get('error', {}).get('message', response.text)
             logger.error(f"Upload failed: {error_msg}")
 
             # Provide specific error guidance
@@ -226,7 +480,7 @@ class PowerBIPublisher:
 
             raise Exception(f"Publish failed: {error_msg}")
 
-        result = response.json()
+        result = _loads(response.content)
         import_id = result.get('id')
 
         # Poll import status
@@ -255,10 +509,13 @@ class PowerBIPublisher:
             error = status.get('error', {}).get('message', 'Unknown error')
             raise Exception(f"Import failed: {error}")
 
-    def _wait_for_import(self, workspace_id: str, import_id: str, timeout: int = 600) -> Dict:
-        """Poll import status until completion"""
+    def _wait_for_import(self, workspace_id: str, import_id: str, timeout: int = 600,
+                         max_interval: float = 30.0) -> Dict:
+        """Poll import status until completion, backing off between checks"""
         start_time = time.time()
-        check_interval = 5
+        min_interval = 2.0
+        check_interval = min_interval
+        last_progress = None
 
         while time.time() - start_time < timeout:
             response = self._make_request("GET", f"groups/{workspace_id}/imports/{import_id}")
@@ -266,17 +523,33 @@ class PowerBIPublisher:
             if response.status_code != 200:
                 raise Exception(f"Failed to check import status: {response.text}")
 
-            status = response.json()
-            state = status.get('importState')
+            # Most polls are still pending - read the state without parsing the whole body
+            match = IMPORT_STATE_RE.search(response.content)
+            state = match.group(1).decode() if match else None
+
+            if state not in PENDING_IMPORT_STATES:
+                status = _loads(response.content)
+                state = status.get('importState')
 
-            if state == 'Succeeded':
-                return status
-            elif state == 'Failed':
-                error = status.get('error', {})
-                raise Exception(f"Import failed: {error.get('message', 'Unknown error')}")
+                if state == 'Succeeded':
+                    return status
+                elif state == 'Failed':
+                    error = status.get('error', {})
+                    raise Exception(f"Import failed: {error.get('message', 'Unknown error')}")
 
-            logger.info(f"Import status: {state}... (elapsed: {int(time.time() - start_time)}s)")
-            time.sleep(check_interval)
+            logger.debug("Import status: %s... (elapsed: %ds)", state, time.time() - start_time)
+
+            remaining = timeout - (time.time() - start_time)
+            time.sleep(max(0.0, min(check_interval, remaining)))
+
+            # Check back sooner while progress is moving, otherwise back off
+            match = IMPORT_PROGRESS_RE.search(response.content)
+            progress = match.group(1) if match else None
+            if progress is not None and progress != last_progress:
+                check_interval = max(min_interval, check_interval / 1.5)
+            else:
+                check_interval = min(check_interval * 1.5, max_interval)
+            last_progress = progress
 
         raise TimeoutError(f"Import timed out after {timeout} seconds")
 
@@ -284,33 +557,13 @@ class PowerBIPublisher:
 # MAIN EXECUTION
 # ============================================================================
 
-def main():
-    """Main execution function"""
+def publish(pbix_file: str, workspace_name: str, report_name: Optional[str] = None) -> int:
+    """Publish a .pbix file to a workspace; returns a process exit code
 
-    parser = argparse.ArgumentParser(
-        description="Publish Power BI report to Power BI Service",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
+    Logging is left to the caller (see setup_logging).
+    """
 
-    parser.add_argument(
-        '--file', '-f',
-        required=True,
-        help='Path to .pbix file'
-    )
-
-    parser.add_argument(
-        '--workspace', '-w',
-        required=True,
-        help='Target workspace name'
-    )
-
-    parser.add_argument(
-        '--name', '-n',
-        required=False,
-        help='Report name (defaults to filename)'
-    )
-
-    args = parser.parse_args()
+    log_file = _active_log_file()
 
     logger.info("=" * 60)
     logger.info("Power BI Report Publisher - Starting")
@@ -318,26 +571,26 @@ def main():
 
     try:
         # Step 1: Validate file
-        pbix_path = Path(args.file).resolve()
-        if not pbix_path.exists():
-            raise FileNotFoundError(f"File not found: {pbix_path}")
+        pbix_path = Path(pbix_file).resolve()
+        stat_result = _stat_pbix(pbix_path)
 
         # Step 2: Authenticate
         authenticator = PowerBIAuthenticator()
         token = authenticator.authenticate()
 
         # Step 3: Initialize publisher
-        publisher = PowerBIPublisher(token)
+        with PowerBIPublisher(token) as publisher:
 
-        # Step 4: Get workspace ID
-        workspace_id = publisher.get_workspace_id(args.workspace)
+            # Step 4: Get workspace ID
+            workspace_id = publisher.get_workspace_id(workspace_name)
 
-        # Step 5: Publish report
-        result = publisher.publish_report(pbix_path, workspace_id, args.name)
+            # Step 5: Publish report
+            result = publisher.publish_report(pbix_path, workspace_id, report_name, stat_result)
 
         logger.info("=" * 60)
         logger.info("Publish operation completed successfully!")
-        logger.info(f"Log file: {LOG_FILE}")
+        if log_file:
+            logger.info(f"Log file: {log_file}")
         logger.info("=" * 60)
 
         return 0
@@ -346,10 +599,112 @@ def main():
         logger.error("=" * 60)
         logger.error("Publish operation FAILED")
         logger.error(f"Error: {str(e)}")
-        logger.error(f"Log file: {LOG_FILE}")
+        if log_file:
+            logger.error(f"Log file: {log_file}")
+        logger.error("=" * 60)
+        return 1
+
+
+def publish_many(paths: List[str], workspace_name: str, max_parallel: int = 4) -> int:
+    """Publish several .pbix files concurrently with one token and session; returns a process exit code"""
+
+    log_file = _active_log_file()
+
+    logger.info("=" * 60)
+    logger.info("Power BI Report Publisher - Starting (%d files)", len(paths))
+    logger.info("=" * 60)
+
+    try:
+        authenticator = PowerBIAuthenticator()
+        token = authenticator.authenticate()
+
+        with PowerBIPublisher(token) as publisher:
+            workspace_id = publisher.get_workspace_id(workspace_name)
+
+            def publish_one(pbix_file: str) -> Dict:
+                pbix_path = Path(pbix_file).resolve()
+                return publisher.publish_report(pbix_path, workspace_id, stat_result=_stat_pbix(pbix_path))
+
+            # The pool size bounds concurrent uploads/imports against the workspace
+            failures = []
+            with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+                futures = {executor.submit(publish_one, pbix_file): pbix_file for pbix_file in paths}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to publish {futures[future]}: {str(e)}")
+                        failures.append(futures[future])
+
+    except Exception as e:
+        logger.error("=" * 60)
+        logger.error("Publish operation FAILED")
+        logger.error(f"Error: {str(e)}")
+        if log_file:
+            logger.error(f"Log file: {log_file}")
         logger.error("=" * 60)
         return 1
 
+    logger.info("=" * 60)
+    if failures:
+        logger.error(f"Published {len(paths) - len(failures)}/{len(paths)} reports")
+        for pbix_file in failures:
+            logger.error(f"  FAILED: {pbix_file}")
+    else:
+        logger.info(f"All {len(paths)} reports published successfully!")
+    if log_file:
+        logger.info(f"Log file: {log_file}")
+    logger.info("=" * 60)
+
+    return 1 if failures else 0
+
+
+def main():
+    """Main execution function"""
+
+    parser = argparse.ArgumentParser(
+        description="Publish Power BI report to Power BI Service",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+
+    parser.add_argument(
+        '--file', '-f',
+        required=True,
+        nargs='+',
+        help='Path to .pbix file(s); several files are published concurrently'
+    )
+
+    parser.add_argument(
+        '--workspace', '-w',
+        required=True,
+        help='Target workspace name'
+    )
+
+    parser.add_argument(
+        '--name', '-n',
+        required=False,
+        help='Report name (defaults to filename)'
+    )
+
+    parser.add_argument(
+        '--parallel',
+        type=int,
+        default=4,
+        help='Maximum concurrent publishes when several files are given (default: 4)'
+    )
+
+    args = parser.parse_args()
+
+    # Only create the log file once we're actually publishing
+    setup_logging()
+
+    if len(args.file) > 1:
+        if args.name:
+            parser.error("--name can only be used with a single --file")
+        return publish_many(args.file, args.workspace, args.parallel)
+
+    return publish(args.file[0], args.workspace, args.name)
+
 
 if __name__ == "__main__":
     sys.exit(main())
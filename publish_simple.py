@@ -7,7 +7,6 @@ No command-line parameters needed!
 
 import sys
 from pathlib import Path
-import subprocess
 
 # ============================================================================
 # CONFIGURATION - EDIT THESE VALUES
@@ -43,20 +42,11 @@ def main():
     print(f"Report:    {CONFIG['report_name'] or '(auto from filename)'}")
     print()
 
-    # Build command
-    cmd = [
-        sys.executable,
-        str(publisher_script),
-        "--file", CONFIG["pbix_file"],
-        "--workspace", CONFIG["workspace_name"]
-    ]
+    # Run the publisher in-process (no second interpreter start-up)
+    from publish_powerbi_report import publish, setup_logging
 
-    if CONFIG["report_name"]:
-        cmd.extend(["--name", CONFIG["report_name"]])
-
-    # Execute
-    result = subprocess.run(cmd)
-    return result.returncode
+    setup_logging()
+    return publish(CONFIG["pbix_file"], CONFIG["workspace_name"], CONFIG["report_name"])
 
 
 if __name__ == "__main__":
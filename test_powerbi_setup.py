@@ -6,6 +6,9 @@ Tests that all prerequisites are met for Power BI publishing automation.
 
 import os
 import sys
+import importlib.util
+from importlib import metadata
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 # Color codes for terminal output
@@ -14,6 +17,9 @@ RED = '\033[91m'
 YELLOW = '\033[93m'
 RESET = '\033[0m'
 
+# Environment variable names containing any of these have their values masked
+_SENSITIVE_KEYWORDS = ('SECRET', 'PASSWORD', 'KEY', 'TOKEN')
+
 def check_python_version() -> Tuple[bool, str]:
     """Check Python version"""
     version = sys.version_info
@@ -22,21 +28,22 @@ def check_python_version() -> Tuple[bool, str]:
     return False, f"Python {version.major}.{version.minor}.{version.micro} (requires 3.8+)"
 
 def check_package(package_name: str) -> Tuple[bool, str]:
-    """Check if Python package is installed"""
-    try:
-        __import__(package_name)
-        module = sys.modules[package_name]
-        version = getattr(module, '__version__', 'unknown version')
-        return True, f"{package_name} ({version})"
-    except ImportError:
+    """Check if Python package is installed (without importing it)"""
+    if importlib.util.find_spec(package_name) is None:
         return False, f"{package_name} not installed"
+    try:
+        version = metadata.version(package_name)
+    except metadata.PackageNotFoundError:
+        version = 'unknown version'
+    return True, f"{package_name} ({version})"
 
 def check_env_var(var_name: str) -> Tuple[bool, str]:
     """Check if environment variable is set"""
     value = os.getenv(var_name)
     if value:
         # Mask sensitive values
-        if 'SECRET' in var_name.upper() or 'PASSWORD' in var_name.upper():
+        upper = var_name.upper()
+        if any(keyword in upper for keyword in _SENSITIVE_KEYWORDS):
             display = value[:4] + '*' * (len(value) - 4) if len(value) > 4 else '***'
         else:
             display = value[:20] + '...' if len(value) > 20 else value
@@ -53,6 +60,36 @@ def check_file_exists(file_path: str) -> Tuple[bool, str]:
         return True, f"{file_path} ({size_mb:.2f} MB)"
     return False, f"{file_path} not found"
 
+def acquire_token(client_id: str, client_secret: str, tenant_id: str) -> dict:
+    """Request a Power BI token for the service principal (reusing the publisher's token cache)"""
+    from msal import ConfidentialClientApplication
+    # Imported after msal so a missing package raises ImportError here, not the publisher's exit
+    from publish_powerbi_report import load_token_cache, save_token_cache
+
+    cache = load_token_cache()
+    authority = f"https://login.microsoftonline.com/{tenant_id}"
+    app = ConfidentialClientApplication(
+        client_id=client_id,
+        client_credential=client_secret,
+        authority=authority,
+        token_cache=cache
+    )
+
+    result = app.acquire_token_for_client(
+        scopes=["https://analysis.windows.net/powerbi/api/.default"]
+    )
+
+    save_token_cache(cache)
+
+    return result
+
+def warm_connection(session) -> None:
+    """Open the TLS connection to the Power BI API ahead of the first real call"""
+    try:
+        session.head("https://api.powerbi.com", timeout=10)
+    except Exception:
+        pass  # The API probe will report any connectivity problem
+
 def print_result(check_name: str, passed: bool, message: str):
     """Print check result with color"""
     status = f"{GREEN}PASS{RESET}" if passed else f"{RED}FAIL{RESET}"
@@ -114,31 +151,36 @@ def main():
     # Test Authentication (if credentials present)
     if all(check_env_var(var)[0] for var in ['PBI_CLIENT_ID', 'PBI_CLIENT_SECRET', 'PBI_TENANT_ID']):
         print_section("Authentication Test")
+        session = None
         try:
-            from msal import ConfidentialClientApplication
-
-            client_id = os.getenv('PBI_CLIENT_ID')
-            client_secret = os.getenv('PBI_CLIENT_SECRET')
-            tenant_id = os.getenv('PBI_TENANT_ID')
-
-            authority = f"https://login.microsoftonline.com/{tenant_id}"
-            app = ConfidentialClientApplication(
-                client_id=client_id,
-                client_credential=client_secret,
-                authority=authority
-            )
+            import requests
+
+            # One session for all API probes; its TLS handshake with Power BI
+            # runs alongside the Azure AD token request
+            session = requests.Session()
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                token_future = executor.submit(
+                    acquire_token,
+                    os.getenv('PBI_CLIENT_ID'),
+                    os.getenv('PBI_CLIENT_SECRET'),
+                    os.getenv('PBI_TENANT_ID')
+                )
+                warm_future = executor.submit(warm_connection, session)
 
-            result = app.acquire_token_for_client(
-                scopes=["https://analysis.windows.net/powerbi/api/.default"]
-            )
+                result = token_future.result()
+                warm_future.result()
 
             if "access_token" in result:
-                print_result("Azure AD Authentication", True, "Successfully acquired token")
+                if result.get("token_source") == "cache":
+                    # A cached token doesn't prove the current secret is still valid
+                    message = "Reused cached token (secret not re-checked until it expires)"
+                else:
+                    message = "Successfully acquired token"
+                print_result("Azure AD Authentication", True, message)
                 all_checks.append(True)
 
                 # Test Power BI API
-                import requests
-                response = requests.get(
+                response = session.get(
                     "https://api.powerbi.com/v1.0/myorg/groups",
                     headers={"Authorization": f"Bearer {result['access_token']}"}
                 )
@@ -164,6 +206,9 @@ def main():
         except Exception as e:
             print_result("Authentication Test", False, str(e))
             all_checks.append(False)
+        finally:
+            if session is not None:
+                session.close()
 
     # Summary
     print_section("Summary")